@@ -1,18 +1,21 @@
 import asyncio
 import json
-import os
 from typing import Any, Dict, Optional
 from urllib import error as urlerror, request as urlrequest
 
+try:
+    from .settings import get_settings  # type: ignore[import]
+except ImportError:  # pragma: no cover - fallback for direct execution
+    from settings import get_settings  # type: ignore[import]
 
-def _get_supabase_rest_base() -> Optional[tuple[str, str]]:
-    """Return (url, service_role_key) if Supabase is configured, else None."""
 
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-    if not url or not key:
+def _get_supabase_rest_base() -> Optional[tuple[str, Dict[str, str]]]:
+    """Return (rest_base_url, headers) if Supabase is configured, else None."""
+
+    settings = get_settings()
+    if not settings.supabase_configured:
         return None
-    return url.rstrip("/"), key
+    return settings.rest_base_url, settings.rest_headers
 
 
 def _post_usage_event(payload: Dict[str, Any]) -> None:
@@ -20,13 +23,11 @@ def _post_usage_event(payload: Dict[str, Any]) -> None:
     if base is None:
         return
 
-    base_url, key = base
-    url = f"{base_url}/rest/v1/usage_events"
+    base_url, base_headers = base
+    url = f"{base_url}/usage_events"
 
     headers = {
-        "apikey": key,
-        "Authorization": f"Bearer {key}",
-        "Accept": "application/json",
+        **base_headers,
         "Content-Type": "application/json",
         "Prefer": "return=minimal",
     }
@@ -56,7 +57,7 @@ async def log_usage_event(
     """
 
     # Environment toggle so this can be disabled entirely if desired.
-    if os.getenv("USAGE_ANALYTICS_ENABLED", "true").lower() not in {"1", "true", "yes"}:
+    if not get_settings().usage_analytics_enabled:
         return
 
     payload: Dict[str, Any] = {"event_type": event}
@@ -0,0 +1,242 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Literal, Optional
+from urllib import error as urlerror, request as urlrequest
+
+from fastapi import Depends, Header, HTTPException, status
+
+try:
+    from .settings import get_settings  # type: ignore[import]
+except ImportError:  # pragma: no cover - fallback for direct execution
+    from settings import get_settings  # type: ignore[import]
+
+# Don't hit the JWKS endpoint more than once per this many seconds when a token
+# names an unknown key id, so forged `kid`s can't trigger a fetch storm.
+MIN_JWKS_REFRESH_SECONDS = 30
+
+CLAIMS_CACHE_SIZE = 1024
+CLAIMS_CACHE_MAX_AGE_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class Actor:
+    """Caller identity taken from a verified Supabase access token."""
+
+    actor_id: str
+    role: Literal["admin", "member"]
+    claims: Dict[str, Any] = field(repr=False)
+
+
+class SigningKeyCache:
+    """Supabase JWT signing keys (JWKS) cached in process.
+
+    Keys are refetched after `ttl_seconds`, or early when a token names a key
+    id we don't have yet (key rotation). Fetch attempts, successful or not,
+    are at least MIN_JWKS_REFRESH_SECONDS apart, and only one thread fetches
+    at a time; the network call happens outside the lock so other requests
+    keep verifying with the keys already cached.
+    """
+
+    def __init__(self, jwks_url: str, ttl_seconds: float) -> None:
+        self._jwks_url = jwks_url
+        self._ttl_seconds = ttl_seconds
+        self._keys: Dict[str, Any] = {}
+        self._fetched_at: Optional[float] = None
+        self._attempted_at: Optional[float] = None
+        self._fetch_done: Optional[threading.Event] = None
+        self._last_error: Optional[HTTPException] = None
+        self._lock = threading.Lock()
+
+    def _download(self) -> Dict[str, Any]:
+        import jwt
+
+        req = urlrequest.Request(self._jwks_url, headers={"Accept": "application/json"}, method="GET")
+        try:
+            with urlrequest.urlopen(req, timeout=5) as resp:
+                data = json.loads(resp.read().decode("utf-8"))
+        except (urlerror.URLError, json.JSONDecodeError, OSError) as e:
+            raise HTTPException(status_code=503, detail=f"Unable to load auth signing keys: {e}")
+
+        try:
+            jwk_set = jwt.PyJWKSet.from_dict(data)
+        except jwt.PyJWKSetError:
+            # No usable asymmetric keys (e.g. an HS256-only project).
+            return {}
+        except jwt.PyJWTError as e:
+            raise HTTPException(status_code=503, detail=f"Invalid auth signing keys: {e}")
+        return {key.key_id: key for key in jwk_set.keys if key.key_id}
+
+    def get(self, kid: str) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            stale = self._fetched_at is None or now - self._fetched_at > self._ttl_seconds
+            wanted = stale or kid not in self._keys
+            can_attempt = self._attempted_at is None or now - self._attempted_at >= MIN_JWKS_REFRESH_SECONDS
+            fetch = wanted and can_attempt and self._fetch_done is None
+            if fetch:
+                self._attempted_at = now
+                self._fetch_done = threading.Event()
+            in_flight = self._fetch_done
+
+        if fetch:
+            error: Optional[HTTPException] = None
+            try:
+                keys = self._download()
+            except HTTPException as e:
+                error = e
+            with self._lock:
+                if error is None:
+                    self._keys = keys
+                    self._fetched_at = time.monotonic()
+                self._last_error = error
+                self._fetch_done = None
+            in_flight.set()
+        elif wanted and in_flight is not None and kid not in self._keys:
+            # Another request is fetching (e.g. first use or rotation); wait for it.
+            in_flight.wait(timeout=5)
+
+        if self._fetched_at is None and self._last_error is not None:
+            # Keys have never loaded; report the outage rather than a bad token.
+            raise self._last_error
+
+        key = self._keys.get(kid)
+        if key is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unknown token signing key")
+        return key
+
+
+class TokenVerifier:
+    """Verify Supabase-issued JWTs locally and memoize recent results.
+
+    Asymmetric tokens are checked against the project's JWKS; legacy HS256
+    tokens against SUPABASE_JWT_SECRET. Decoded claims for recently seen
+    tokens are kept in a small LRU until the token expires (or
+    CLAIMS_CACHE_MAX_AGE_SECONDS pass), so repeat requests skip signature
+    checks entirely.
+    """
+
+    def __init__(self, *, issuer: Optional[str], audience: str, keys: Optional[SigningKeyCache], hs256_secret: Optional[str]) -> None:
+        self._issuer = issuer
+        self._audience = audience
+        self._keys = keys
+        self._hs256_secret = hs256_secret
+        self._claims: "OrderedDict[str, tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _cached(self, token: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            entry = self._claims.get(token)
+            if entry is None:
+                return None
+            if entry[1] <= now:
+                del self._claims[token]
+                return None
+            self._claims.move_to_end(token)
+            return entry[0]
+
+    def _remember(self, token: str, claims: Dict[str, Any]) -> None:
+        expires_at = min(float(claims["exp"]), time.time() + CLAIMS_CACHE_MAX_AGE_SECONDS)
+        with self._lock:
+            self._claims[token] = (claims, expires_at)
+            self._claims.move_to_end(token)
+            while len(self._claims) > CLAIMS_CACHE_SIZE:
+                self._claims.popitem(last=False)
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        claims = self._cached(token)
+        if claims is not None:
+            return claims
+
+        import jwt
+
+        try:
+            header = jwt.get_unverified_header(token)
+            alg = header.get("alg")
+            if alg == "HS256":
+                if not self._hs256_secret:
+                    raise jwt.InvalidTokenError("HS256 tokens are not accepted")
+                key: Any = self._hs256_secret
+            else:
+                if self._keys is None or not header.get("kid"):
+                    raise jwt.InvalidTokenError("Token has no verifiable signing key")
+                key = self._keys.get(header["kid"])
+                # Only accept the algorithm the key itself is published for.
+                alg = key.algorithm_name
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=[alg],
+                audience=self._audience,
+                issuer=self._issuer,
+                options={"require": ["exp", "sub"]},
+            )
+        except jwt.PyJWTError as e:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=f"Invalid token: {e}")
+
+        self._remember(token, claims)
+        return claims
+
+
+@lru_cache(maxsize=1)
+def get_token_verifier() -> TokenVerifier:
+    settings = get_settings()
+    if not settings.supabase_url and not settings.supabase_jwt_secret:
+        raise HTTPException(status_code=500, detail="Supabase auth is not configured")
+
+    auth_base = f"{settings.supabase_url.rstrip('/')}/auth/v1" if settings.supabase_url else None
+    keys = (
+        SigningKeyCache(f"{auth_base}/.well-known/jwks.json", ttl_seconds=settings.jwks_cache_ttl_seconds)
+        if auth_base
+        else None
+    )
+    return TokenVerifier(
+        issuer=auth_base,
+        audience=settings.jwt_audience,
+        keys=keys,
+        hs256_secret=settings.supabase_jwt_secret,
+    )
+
+
+def _actor_from_claims(claims: Dict[str, Any]) -> Actor:
+    # Team role lives in `app_metadata.role`, which only the service role can set.
+    app_metadata = claims.get("app_metadata") or {}
+    role = "admin" if app_metadata.get("role") == "admin" else "member"
+    return Actor(actor_id=str(claims["sub"]), role=role, claims=claims)
+
+
+def get_optional_actor(authorization: Optional[str] = Header(default=None)) -> Optional[Actor]:
+    """FastAPI dependency: the verified caller, or None when no token is sent."""
+
+    if not authorization:
+        return None
+
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Expected a Bearer token")
+
+    return _actor_from_claims(get_token_verifier().verify(token.strip()))
+
+
+def get_current_actor(actor: Optional[Actor] = Depends(get_optional_actor)) -> Actor:
+    """FastAPI dependency: the verified caller; 401 if unauthenticated."""
+
+    if actor is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return actor
+
+
+def require_admin(actor: Actor = Depends(get_current_actor)) -> Actor:
+    """FastAPI dependency: the verified caller, who must have the admin role."""
+
+    if actor.role != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin role required")
+    return actor
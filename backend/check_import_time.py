@@ -0,0 +1,57 @@
+"""Cold-start import benchmark for the FastAPI backend.
+
+Imports `main` in fresh interpreters (as a serverless cold start would) and
+fails if the median import time exceeds the budget. CI runs it on every push
+and pull request that touches `backend/` (`.github/workflows/backend.yml`);
+run it locally from the backend folder:
+
+    python check_import_time.py
+
+The default budget sits just above the measured baseline (~450-550 ms), so a
+new heavy top-level import fails it. Tune with IMPORT_TIME_BUDGET_MS
+(default 700) and IMPORT_TIME_RUNS (default 5).
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+
+_SNIPPET = (
+    "import time; start = time.perf_counter(); import main; "
+    "print((time.perf_counter() - start) * 1000)"
+)
+
+
+def measure_import_ms() -> float:
+    """Import `main` in a new interpreter and return the elapsed milliseconds."""
+
+    result = subprocess.run(
+        [sys.executable, "-c", _SNIPPET],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    budget_ms = float(os.getenv("IMPORT_TIME_BUDGET_MS", "700"))
+    runs = max(1, int(os.getenv("IMPORT_TIME_RUNS", "5")))
+
+    samples = [measure_import_ms() for _ in range(runs)]
+    median_ms = statistics.median(samples)
+
+    print(f"import main: median {median_ms:.1f} ms over {runs} runs (budget {budget_ms:.0f} ms)")
+    if median_ms > budget_ms:
+        print("Cold-start import time is over budget.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+import json
+import os
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class ColdRecord(NamedTuple):
+    """Location of one compressed record inside the cold-storage file."""
+
+    offset: int
+    length: int
+
+
+class ColdStorage:
+    """Append-only, zlib-compressed record file for rarely read data.
+
+    Each record is compressed on its own so it can be read back by offset
+    without touching the rest of the file. Space from records that were read
+    back and dropped is not reclaimed until the process restarts.
+
+    The file only backs in-memory state of one process, so a configured path
+    gets a per-process suffix (e.g. `trash.1234.bin`) and is truncated when
+    opened; several workers never share a file. If no path is given a
+    temporary file is created on first write. `close` deletes the file.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self._lock = threading.Lock()
+        self._path: Optional[Path] = None
+        if path is not None:
+            self._path = path.with_name(f"{path.stem}.{os.getpid()}{path.suffix or '.bin'}")
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._path.write_bytes(b"")
+
+    def _ensure_path(self) -> Path:
+        if self._path is None:
+            with tempfile.NamedTemporaryFile(prefix=f"taskvault-cold-{os.getpid()}-", suffix=".bin", delete=False) as f:
+                self._path = Path(f.name)
+        return self._path
+
+    def put(self, record: Dict[str, Any]) -> ColdRecord:
+        blob = zlib.compress(json.dumps(record, separators=(",", ":")).encode("utf-8"))
+        with self._lock:
+            with open(self._ensure_path(), "ab") as f:
+                offset = f.seek(0, 2)
+                f.write(blob)
+        return ColdRecord(offset=offset, length=len(blob))
+
+    def get(self, location: ColdRecord) -> Dict[str, Any]:
+        with self._lock:
+            with open(self._ensure_path(), "rb") as f:
+                f.seek(location.offset)
+                blob = f.read(location.length)
+        try:
+            return json.loads(zlib.decompress(blob).decode("utf-8"))
+        except zlib.error as e:
+            raise ValueError(f"Corrupt cold-storage record at offset {location.offset}") from e
+
+    def close(self) -> None:
+        """Delete the backing file; stored records are no longer readable."""
+
+        with self._lock:
+            if self._path is not None:
+                self._path.unlink(missing_ok=True)
+                self._path = None
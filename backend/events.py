@@ -0,0 +1,69 @@
+import asyncio
+import json
+import threading
+from typing import Any, Dict, Optional, Set
+
+# Frames each client may have queued before it is considered too slow and
+# told to resync instead.
+DEFAULT_CLIENT_BUFFER = 64
+
+KEEPALIVE_FRAME = b": keep-alive\n\n"
+
+
+def encode_sse(event_id: int, event: str, data: Dict[str, Any]) -> bytes:
+    payload = json.dumps(data, separators=(",", ":"), default=str)
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n".encode("utf-8")
+
+
+class Broadcaster:
+    """Fan-out of server-sent change events to connected clients.
+
+    Each event is encoded once and the same bytes are queued for every
+    subscriber. Per-client queues are bounded: a client that falls behind has
+    its backlog dropped and receives a single `resync` event telling it to
+    refetch. Publishing with no subscribers is a no-op.
+
+    `publish` is safe to call from worker threads (sync endpoints) as well as
+    from the event loop.
+    """
+
+    def __init__(self, client_buffer: int = DEFAULT_CLIENT_BUFFER) -> None:
+        self._client_buffer = client_buffer
+        self._subscribers: Set[asyncio.Queue[bytes]] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._next_id = 1
+        self._id_lock = threading.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> "asyncio.Queue[bytes]":
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=self._client_buffer)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: "asyncio.Queue[bytes]") -> None:
+        self._subscribers.discard(queue)
+
+    def publish(self, event: str, data: Dict[str, Any]) -> None:
+        loop = self._loop
+        if not self._subscribers or loop is None or loop.is_closed():
+            return
+
+        with self._id_lock:
+            event_id = self._next_id
+            self._next_id += 1
+
+        frame = encode_sse(event_id, event, data)
+        loop.call_soon_threadsafe(self._deliver, event_id, frame)
+
+    def _deliver(self, event_id: int, frame: bytes) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(encode_sse(event_id, "resync", {}))
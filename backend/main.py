@@ -1,27 +1,42 @@
+import asyncio
 import json
-import os
+import logging
+import threading
 import time
-from datetime import datetime, timedelta
+from bisect import insort
+from contextlib import asynccontextmanager, suppress
+from datetime import date, datetime, timedelta
 from urllib import error as urlerror, request as urlrequest
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Literal, Optional
-from dotenv import load_dotenv
-from pathlib import Path
 
 try:
     # When imported as a package module (e.g. `backend.main`).
-    from .permissions import enforce_team_limit  # type: ignore[import]
+    from .settings import get_settings  # type: ignore[import]
+    from .permissions import PlanCache, enforce_team_limit  # type: ignore[import]
     from .analytics import log_usage_event  # type: ignore[import]
+    from .workflow_index import WorkflowIndex  # type: ignore[import]
+    from .cold_storage import ColdRecord, ColdStorage  # type: ignore[import]
+    from .events import KEEPALIVE_FRAME, Broadcaster  # type: ignore[import]
+    from .auth import Actor, get_current_actor, require_admin  # type: ignore[import]
 except ImportError:  # pragma: no cover - fallback for direct execution
     # Fallback for running `main.py` directly or via `uvicorn main:app` from the backend folder.
-    from permissions import enforce_team_limit  # type: ignore[import]
+    from settings import get_settings  # type: ignore[import]
+    from permissions import PlanCache, enforce_team_limit  # type: ignore[import]
     from analytics import log_usage_event  # type: ignore[import]
+    from workflow_index import WorkflowIndex  # type: ignore[import]
+    from cold_storage import ColdRecord, ColdStorage  # type: ignore[import]
+    from events import KEEPALIVE_FRAME, Broadcaster  # type: ignore[import]
+    from auth import Actor, get_current_actor, require_admin  # type: ignore[import]
 
-BASE_DIR = Path(__file__).resolve().parent
-load_dotenv(BASE_DIR / ".env")
+# Resolve configuration (and load `.env` if present) once per process.
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
 
 try:
     # When imported as a package module (e.g. `backend.main`).
@@ -31,15 +46,26 @@ except ImportError:
     from supabase_client import check_supabase_connection
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    compactor = None
+    if settings.trash_compact_interval_seconds > 0:
+        compactor = asyncio.create_task(_run_trash_compactor(settings.trash_compact_interval_seconds))
+    try:
+        yield
+    finally:
+        if compactor is not None:
+            compactor.cancel()
+            with suppress(asyncio.CancelledError):
+                await compactor
+        cold_storage.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Allow frontend (Next.js dev / deployed) to call this API from the browser.
 # In production, set FRONTEND_ORIGINS in the environment (comma-separated list).
-frontend_origins_env = os.getenv("FRONTEND_ORIGINS")
-if frontend_origins_env:
-    allowed_origins = [origin.strip() for origin in frontend_origins_env.split(",") if origin.strip()]
-else:
-    allowed_origins = ["http://localhost:3000", "http://127.0.0.1:3000"]
+allowed_origins = settings.frontend_origins
 
 app.add_middleware(
     CORSMiddleware,
@@ -92,6 +118,47 @@ def health_check():
     }
 
 
+# -----------------------------
+# Change feed (server-sent events)
+# -----------------------------
+
+# Shared fan-out for /events; see `events.Broadcaster`.
+change_feed = Broadcaster()
+
+KEEPALIVE_SECONDS = 15
+
+
+@app.get("/events")
+async def stream_events() -> StreamingResponse:
+    """Server-sent events stream of compact change deltas.
+
+    Event types: `workflow_created` and `workflow_restored` (with the
+    workflow), `step_updated`, `workflow_deleted`, `workflows_archived`,
+    `team_changed`, `stats` (workflow counter deltas matching
+    `/analytics/overview`) and `resync` (the client fell behind and should
+    refetch).
+    """
+
+    queue = change_feed.subscribe()
+
+    async def stream():
+        try:
+            while True:
+                try:
+                    frame = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    frame = KEEPALIVE_FRAME
+                yield frame
+        finally:
+            change_feed.unsubscribe(queue)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # -----------------------------
 # Phase 3: Workflow management
 # -----------------------------
@@ -114,8 +181,55 @@ class Workflow(WorkflowCreate):
 
 
 workflows: List[Workflow] = []
+workflows_by_id: dict[int, Workflow] = {}
 next_workflow_id: int = 1
 
+# Assignee and title indexes over active (non-deleted) workflows.
+workflow_index = WorkflowIndex()
+
+
+class ArchivedWorkflow(BaseModel):
+    """Hot-memory stub for a trashed workflow moved to cold storage."""
+
+    id: int
+    title: str
+    deleted_at: datetime
+    step_count: int
+
+
+# Workflows deleted longer than the retention period live compressed in cold
+# storage; only their stubs stay in memory.
+cold_storage = ColdStorage(settings.trash_cold_storage_file)
+archived_workflows: dict[int, tuple[ArchivedWorkflow, ColdRecord]] = {}
+
+# Serializes soft delete, restore, compaction and step edits so a workflow is
+# never archived while it is being restored or edited, and the search index
+# never gains postings for a trashed workflow.
+_trash_lock = threading.Lock()
+
+
+def _workflow_stats_delta(workflow: Workflow, sign: int = 1, into: Optional[dict[str, int]] = None) -> dict[str, int]:
+    """Return this workflow's contribution to `WorkflowStats`, times `sign`."""
+
+    delta = into if into is not None else {}
+    for key, amount in (
+        ("total", 1),
+        ("with_steps" if workflow.steps else "without_steps", 1),
+        ("total_steps", len(workflow.steps)),
+    ):
+        delta[key] = delta.get(key, 0) + sign * amount
+    for step in workflow.steps:
+        key = f"{step.status}_steps"
+        delta[key] = delta.get(key, 0) + sign
+    return delta
+
+
+def _get_workflow(workflow_id: int) -> Workflow:
+    workflow = workflows_by_id.get(workflow_id)
+    if workflow is None:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+    return workflow
+
 
 @app.post("/workflows", response_model=Workflow)
 async def create_workflow(payload: WorkflowCreate) -> Workflow:
@@ -127,6 +241,10 @@ async def create_workflow(payload: WorkflowCreate) -> Workflow:
     workflow = Workflow(id=next_workflow_id, **payload.model_dump())
     next_workflow_id += 1
     workflows.append(workflow)
+    workflows_by_id[workflow.id] = workflow
+    workflow_index.add_workflow(workflow.id, workflow.title, workflow.steps)
+    change_feed.publish("workflow_created", {"workflow": workflow.model_dump(mode="json")})
+    change_feed.publish("stats", {"workflows": _workflow_stats_delta(workflow)})
     # Best-effort analytics: log workflow creation.
     await log_usage_event(user_id=None, event="workflow_created", metadata={"workflow_id": workflow.id})
     _write_audit_log("WORKFLOW_CREATED", target=str(workflow.id))
@@ -141,11 +259,61 @@ def list_workflows() -> List[Workflow]:
 
 @app.get("/workflows/deleted", response_model=List[Workflow])
 def list_deleted_workflows() -> List[Workflow]:
-    """Return soft-deleted workflows for the "trash" view."""
+    """Return soft-deleted workflows for the "trash" view.
+
+    Workflows past the trash retention period are listed by
+    `/workflows/archived` instead.
+    """
 
     return [w for w in workflows if w.deleted_at is not None]
 
 
+@app.get("/workflows/archived", response_model=List[ArchivedWorkflow])
+def list_archived_workflows() -> List[ArchivedWorkflow]:
+    """Return stubs for trashed workflows that were moved to cold storage."""
+
+    return [stub for stub, _ in archived_workflows.values()]
+
+
+@app.get("/workflows/search", response_model=List[Workflow])
+def search_workflows(q: str) -> List[Workflow]:
+    """Search active workflows by prefix over workflow and step title words.
+
+    Every word in `q` must prefix-match a word in the workflow title or in one
+    of its step titles.
+    """
+
+    return [workflows_by_id[workflow_id] for workflow_id in workflow_index.search_workflows(q)]
+
+
+class AssignedStep(BaseModel):
+    workflow_id: int
+    workflow_title: str
+    step_index: int
+    step: Step
+
+
+@app.get("/steps", response_model=List[AssignedStep])
+def list_assigned_steps(assigned_to: str) -> List[AssignedStep]:
+    """Return every step of an active workflow assigned to `assigned_to`.
+
+    Matching ignores case and surrounding whitespace.
+    """
+
+    results = []
+    for workflow_id, step_index in workflow_index.steps_assigned_to(assigned_to):
+        workflow = workflows_by_id[workflow_id]
+        results.append(
+            AssignedStep(
+                workflow_id=workflow_id,
+                workflow_title=workflow.title,
+                step_index=step_index,
+                step=workflow.steps[step_index],
+            )
+        )
+    return results
+
+
 class StepUpdate(BaseModel):
     title: Optional[str] = None
     assigned_to: Optional[str] = None
@@ -154,22 +322,41 @@ class StepUpdate(BaseModel):
 
 @app.patch("/workflows/{workflow_id}/steps/{step_index}", response_model=Workflow)
 def update_step(workflow_id: int, step_index: int, update: StepUpdate) -> Workflow:
-    try:
-        workflow = next(w for w in workflows if w.id == workflow_id)
-    except StopIteration:
-        raise HTTPException(status_code=404, detail="Workflow not found")
-
-    if step_index < 0 or step_index >= len(workflow.steps):
-        raise HTTPException(status_code=404, detail="Step not found")
-
-    step = workflow.steps[step_index]
-
-    if update.title is not None:
-        step.title = update.title
-    if update.assigned_to is not None:
-        step.assigned_to = update.assigned_to
-    if update.status is not None:
-        step.status = update.status
+    with _trash_lock:
+        # Look the workflow up under the lock: compaction serializes trashed
+        # workflows while holding it, so an edit either lands before the cold
+        # record is written or finds the workflow archived (404). Likewise a
+        # soft delete can't land between the deleted check and `add_step`.
+        workflow = _get_workflow(workflow_id)
+
+        if step_index < 0 or step_index >= len(workflow.steps):
+            raise HTTPException(status_code=404, detail="Step not found")
+
+        step = workflow.steps[step_index]
+        old_status = step.status
+        reindex = workflow.deleted_at is None and (update.title is not None or update.assigned_to is not None)
+        if reindex:
+            workflow_index.remove_step(workflow.id, step_index, step)
+
+        if update.title is not None:
+            step.title = update.title
+        if update.assigned_to is not None:
+            step.assigned_to = update.assigned_to
+        if update.status is not None:
+            step.status = update.status
+
+        if reindex:
+            workflow_index.add_step(workflow.id, step_index, step)
+
+    change_feed.publish(
+        "step_updated",
+        {"workflow_id": workflow.id, "step_index": step_index, "step": step.model_dump()},
+    )
+    if step.status != old_status:
+        change_feed.publish(
+            "stats",
+            {"workflows": {f"{old_status}_steps": -1, f"{step.status}_steps": 1}},
+        )
 
     return workflow
 
@@ -178,28 +365,103 @@ def update_step(workflow_id: int, step_index: int, update: StepUpdate) -> Workfl
 def soft_delete_workflow(workflow_id: int) -> None:
     """Soft-delete a workflow by setting deleted_at instead of removing it."""
 
-    try:
-        workflow = next(w for w in workflows if w.id == workflow_id)
-    except StopIteration:
-        raise HTTPException(status_code=404, detail="Workflow not found")
+    with _trash_lock:
+        if workflow_id in archived_workflows:
+            # Already deleted and compacted.
+            return
 
-    if workflow.deleted_at is None:
-        workflow.deleted_at = datetime.utcnow()
+        workflow = _get_workflow(workflow_id)
+
+        if workflow.deleted_at is None:
+            workflow.deleted_at = datetime.utcnow()
+            workflow_index.remove_workflow(workflow.id, workflow.title, workflow.steps)
+            change_feed.publish("workflow_deleted", {"id": workflow.id})
 
 
 @app.post("/workflows/{workflow_id}/restore", response_model=Workflow)
 def restore_workflow(workflow_id: int) -> Workflow:
-    """Restore a soft-deleted workflow back to the active list."""
+    """Restore a soft-deleted workflow back to the active list.
 
-    try:
-        workflow = next(w for w in workflows if w.id == workflow_id)
-    except StopIteration:
-        raise HTTPException(status_code=404, detail="Workflow not found")
+    Archived workflows are loaded back from cold storage on demand.
+    """
 
-    workflow.deleted_at = None
+    with _trash_lock:
+        archived = archived_workflows.get(workflow_id)
+        if archived is not None:
+            _, location = archived
+            try:
+                workflow = Workflow.model_validate(cold_storage.get(location))
+            except (OSError, ValueError):
+                # Keep the stub so the restore can be retried.
+                logger.exception("Failed to load archived workflow %s from cold storage", workflow_id)
+                raise HTTPException(status_code=503, detail="Archived workflow could not be loaded; try again later")
+            del archived_workflows[workflow_id]
+            insort(workflows, workflow, key=lambda w: w.id)
+            workflows_by_id[workflow.id] = workflow
+            change_feed.publish("stats", {"workflows": _workflow_stats_delta(workflow)})
+        else:
+            workflow = _get_workflow(workflow_id)
+
+        if workflow.deleted_at is not None:
+            workflow.deleted_at = None
+            workflow_index.add_workflow(workflow.id, workflow.title, workflow.steps)
+            change_feed.publish("workflow_restored", {"workflow": workflow.model_dump(mode="json")})
     return workflow
 
 
+def compact_trash(now: Optional[datetime] = None) -> int:
+    """Move workflows deleted longer than the retention period to cold storage.
+
+    Returns the number of workflows archived.
+    """
+
+    cutoff = (now or datetime.utcnow()) - timedelta(days=settings.trash_retention_days)
+
+    with _trash_lock:
+        expired = [w for w in workflows if w.deleted_at is not None and w.deleted_at <= cutoff]
+        if not expired:
+            return 0
+
+        # Write every cold record before touching the in-memory maps, so a
+        # failed write leaves the hot state unchanged.
+        locations = [cold_storage.put(workflow.model_dump(mode="json")) for workflow in expired]
+
+        for workflow, location in zip(expired, locations):
+            stub = ArchivedWorkflow(
+                id=workflow.id,
+                title=workflow.title,
+                deleted_at=workflow.deleted_at,
+                step_count=len(workflow.steps),
+            )
+            archived_workflows[workflow.id] = (stub, location)
+            workflows_by_id.pop(workflow.id, None)
+            # Remove in place (by identity): create_workflow may append
+            # concurrently from the event loop without taking _trash_lock, and
+            # appends never shift the index found here.
+            index = next(i for i, w in enumerate(workflows) if w is workflow)
+            del workflows[index]
+
+        expired_ids = {w.id for w in expired}
+
+    # Archived workflows drop out of the in-memory analytics.
+    stats_delta: dict[str, int] = {}
+    for workflow in expired:
+        _workflow_stats_delta(workflow, -1, into=stats_delta)
+    change_feed.publish("workflows_archived", {"ids": sorted(expired_ids)})
+    change_feed.publish("stats", {"workflows": stats_delta})
+    return len(expired)
+
+
+async def _run_trash_compactor(interval_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(compact_trash)
+        except Exception:
+            # Never let one bad cycle stop the compactor; retry next cycle.
+            logger.exception("Trash compaction failed")
+
+
 # -----------------------------
 # Phase 4: User & team management
 # -----------------------------
@@ -217,13 +479,16 @@ class TeamMemberOut(TeamMember):
 class TeamAddRequest(BaseModel):
     email: str
     role: Literal["admin", "member"] = "member"
-    plan: Literal["free", "pro"]
 
 
 class TeamRoleUpdate(BaseModel):
     role: Literal["admin", "member"]
 
 
+class AccountPlan(BaseModel):
+    plan: str
+
+
 class AuditLog(BaseModel):
     id: str
     actor_id: Optional[str] = None
@@ -233,12 +498,12 @@ class AuditLog(BaseModel):
     created_at: datetime
 
 
-def _get_supabase_rest_base() -> tuple[str, str]:
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-    if not url or not key:
+def _get_supabase_rest_base() -> tuple[str, dict[str, str]]:
+    """Return the PostgREST base URL and the prebuilt service-role headers."""
+
+    if not settings.supabase_configured:
         raise HTTPException(status_code=500, detail="Supabase is not configured for team API")
-    return url.rstrip("/"), key
+    return settings.rest_base_url, settings.rest_headers
 
 
 def _supabase_rest_request(
@@ -249,16 +514,12 @@ def _supabase_rest_request(
     body: dict | None = None,
     extra_headers: dict | None = None,
 ) -> tuple[int, object | None]:
-    base_url, key = _get_supabase_rest_base()
-    url = f"{base_url}/rest/v1/{path}"
+    base_url, base_headers = _get_supabase_rest_base()
+    url = f"{base_url}/{path}"
     if query:
         url = f"{url}?{query}"
 
-    headers = {
-        "apikey": key,
-        "Authorization": f"Bearer {key}",
-        "Accept": "application/json",
-    }
+    headers = dict(base_headers)
     if body is not None:
         headers["Content-Type"] = "application/json"
     if extra_headers:
@@ -287,6 +548,26 @@ def _supabase_rest_request(
         raise HTTPException(status_code=500, detail=f"Supabase error: {e}")
 
 
+def _fetch_subscription_plan(account_id: str) -> Optional[str]:
+    """Read `profiles.subscription_plan` for an account; None if there is no profile."""
+
+    status, data = _supabase_rest_request(
+        "GET",
+        "profiles",
+        query=f"id=eq.{account_id}&select=subscription_plan&limit=1",
+    )
+    if status != 200:
+        raise HTTPException(status_code=502, detail="Failed to load subscription plan from Supabase")
+
+    rows = data or []
+    if not rows:
+        return None
+    return rows[0].get("subscription_plan")
+
+
+plan_cache = PlanCache(_fetch_subscription_plan, ttl_seconds=settings.plan_cache_ttl_seconds)
+
+
 def _write_audit_log(action: str, target: str | None = None, *, actor_id: str | None = None, actor_role: str | None = None) -> None:
     """Best-effort audit logging to Supabase `audit_logs` table.
 
@@ -393,18 +674,13 @@ def _rate_limit(identifier: str, endpoint: str, limit_key: str) -> None:
 @app.get("/audit-logs", response_model=List[AuditLog])
 def list_audit_logs(
     limit: int = 50,
-    actor_role: Literal["admin", "member"] = "member",
+    actor: Actor = Depends(require_admin),
 ) -> List[AuditLog]:
     """List recent audit log entries.
 
-    In a real deployment, `actor_role` would come from authentication
-    (e.g. a JWT or Supabase session). Here it's a simple query parameter
-    to demonstrate admin-only access.
+    Admin-only; the caller's role comes from their verified Supabase JWT.
     """
 
-    if actor_role != "admin":
-        raise HTTPException(status_code=403, detail="Only admins can view audit logs")
-
     if limit <= 0:
         limit = 50
     if limit > 200:
@@ -453,11 +729,14 @@ def list_team() -> List[TeamMemberOut]:
 
 
 @app.post("/team/add", response_model=TeamMemberOut)
-async def add_member(payload: TeamAddRequest) -> TeamMemberOut:
+async def add_member(
+    payload: TeamAddRequest,
+    actor: Actor = Depends(get_current_actor),
+) -> TeamMemberOut:
     """Add a team member while enforcing subscription limits using Supabase storage.
 
-    - Free plan: max 2 members
-    - Pro plan: max 10 members
+    Limits per plan come from `plan_limits.json`. The plan is read from the
+    signed-in caller's Supabase `profiles` row, through a TTL cache.
     """
 
     # Basic write-rate limiting keyed by a generic identifier.
@@ -469,7 +748,9 @@ async def add_member(payload: TeamAddRequest) -> TeamMemberOut:
     if any(m.email.lower() == payload.email.lower() for m in existing):
         raise HTTPException(status_code=400, detail="Member with this email already exists")
 
-    enforce_team_limit(payload.plan, len(existing))
+    plan = plan_cache.get(actor.actor_id)
+
+    enforce_team_limit(plan, len(existing))
 
     status, data = _supabase_rest_request(
         "POST",
@@ -491,30 +772,39 @@ async def add_member(payload: TeamAddRequest) -> TeamMemberOut:
 
     # Best-effort analytics: log team growth against plan.
     await log_usage_event(
-        user_id=None,
+        user_id=actor.actor_id,
         event="team_member_added",
-        metadata={"email": member.email, "role": member.role, "plan": payload.plan},
+        metadata={"email": member.email, "role": member.role, "plan": plan},
     )
 
-    _write_audit_log("ADD_TEAM_MEMBER", target=member.email, actor_role="admin")
+    _write_audit_log("ADD_TEAM_MEMBER", target=member.email, actor_id=actor.actor_id, actor_role=actor.role)
+    change_feed.publish("team_changed", {"action": "added", "member": member.model_dump()})
 
     return member
 
 
+@app.post("/account/plan/refresh", response_model=AccountPlan)
+def refresh_account_plan(actor: Actor = Depends(get_current_actor)) -> AccountPlan:
+    """Re-read the caller's subscription plan into the plan cache.
+
+    Call this after the plan changes so limits apply immediately instead of
+    after the cache TTL expires.
+    """
+
+    return AccountPlan(plan=plan_cache.refresh(actor.actor_id))
+
+
 @app.patch("/team/{member_id}/role", response_model=TeamMemberOut)
 def update_member_role(
     member_id: int,
     update: TeamRoleUpdate,
-    actor_role: Literal["admin", "member"] = "member",
+    actor: Actor = Depends(require_admin),
 ) -> TeamMemberOut:
     """Update a member's role.
 
-    Only callers acting as an admin are allowed to change roles.
+    Only callers whose verified token carries the admin role may change roles.
     """
 
-    if actor_role != "admin":
-        raise HTTPException(status_code=403, detail="Only admins can update roles")
-
     status, data = _supabase_rest_request(
         "PATCH",
         "team_members",
@@ -532,23 +822,21 @@ def update_member_role(
 
     row = rows[0]
     member = TeamMemberOut(id=row["id"], email=row["email"], role=row["role"])
-    _write_audit_log("UPDATE_TEAM_ROLE", target=member.email, actor_role="admin")
+    _write_audit_log("UPDATE_TEAM_ROLE", target=member.email, actor_id=actor.actor_id, actor_role=actor.role)
+    change_feed.publish("team_changed", {"action": "role_updated", "member": member.model_dump()})
     return member
 
 
 @app.delete("/team/{member_id}", status_code=204)
 def remove_member(
     member_id: int,
-    actor_role: Literal["admin", "member"] = "member",
+    actor: Actor = Depends(require_admin),
 ) -> None:
     """Remove a team member.
 
-    Only callers acting as an admin are allowed to remove members.
+    Only callers whose verified token carries the admin role may remove members.
     """
 
-    if actor_role != "admin":
-        raise HTTPException(status_code=403, detail="Only admins can remove members")
-
     status, _ = _supabase_rest_request(
         "DELETE",
         "team_members",
@@ -556,12 +844,14 @@ def remove_member(
     )
 
     if status == 204:
-        _write_audit_log("REMOVE_TEAM_MEMBER", target=str(member_id), actor_role="admin")
+        _write_audit_log("REMOVE_TEAM_MEMBER", target=str(member_id), actor_id=actor.actor_id, actor_role=actor.role)
+        change_feed.publish("team_changed", {"action": "removed", "member_id": member_id})
         return
 
     if status == 200:
         # Some PostgREST configs may return 200 with a body, treat as success.
-        _write_audit_log("REMOVE_TEAM_MEMBER", target=str(member_id), actor_role="admin")
+        _write_audit_log("REMOVE_TEAM_MEMBER", target=str(member_id), actor_id=actor.actor_id, actor_role=actor.role)
+        change_feed.publish("team_changed", {"action": "removed", "member_id": member_id})
         return
 
     raise HTTPException(status_code=404, detail="Member not found")
@@ -598,7 +888,7 @@ def analytics_overview() -> AnalyticsOverview:
     """Return high-level workflow and team usage metrics.
 
     - Workflow stats are computed from the in-memory Phase 3 workflows list.
-    - Team stats are computed from the Supabase-backed team_members table.
+    - Team stats are counted in Supabase by the `team_member_stats` function.
     """
 
     # Workflow statistics (in-memory)
@@ -636,17 +926,70 @@ def analytics_overview() -> AnalyticsOverview:
     # If Supabase/team storage is not yet fully configured, degrade gracefully
     # by treating team metrics as zero instead of failing the entire endpoint.
     try:
-        members_list = list_team()
+        team_stats = _team_stats()
     except HTTPException:
-        members_list = []
-    total_members = len(members_list)
-    admins = sum(1 for m in members_list if m.role == "admin")
-    members = sum(1 for m in members_list if m.role == "member")
-
-    team_stats = TeamStats(
-        total_members=total_members,
-        admins=admins,
-        members=members,
-    )
+        team_stats = TeamStats(total_members=0, admins=0, members=0)
 
     return AnalyticsOverview(workflows=workflow_stats, team=team_stats)
+
+
+def _team_stats() -> TeamStats:
+    """Load team composition counts via the `team_member_stats` SQL function.
+
+    Counting happens in Postgres (see `supbase/04_analytics_functions.sql`), so
+    only a single row is transferred regardless of team size.
+    """
+
+    status, data = _supabase_rest_request("POST", "rpc/team_member_stats", body={})
+    if status != 200:
+        raise HTTPException(status_code=502, detail="Failed to load team stats from Supabase")
+
+    rows = data or []
+    row = rows[0] if rows else {}
+    return TeamStats(
+        total_members=int(row.get("total_members") or 0),
+        admins=int(row.get("admins") or 0),
+        members=int(row.get("members") or 0),
+    )
+
+
+class UsageEventDailyCount(BaseModel):
+    day: date
+    event_type: str
+    count: int
+
+
+@app.get("/analytics/usage-events", response_model=List[UsageEventDailyCount])
+def usage_event_daily_counts(
+    days: int = 30,
+    event_type: Optional[str] = None,
+) -> List[UsageEventDailyCount]:
+    """Return per-event-type daily counts from the `usage_events` table.
+
+    Aggregation runs server-side in the `usage_event_daily_counts` SQL
+    function, which is backed by `idx_usage_events_event_type_created_at`.
+    """
+
+    if days <= 0:
+        days = 30
+    if days > 365:
+        days = 365
+
+    since = datetime.utcnow() - timedelta(days=days)
+    body: dict[str, object] = {"p_since": since.isoformat() + "Z"}
+    if event_type:
+        body["p_event_type"] = event_type
+
+    status, data = _supabase_rest_request("POST", "rpc/usage_event_daily_counts", body=body)
+    if status != 200:
+        raise HTTPException(status_code=502, detail="Failed to load usage events from Supabase")
+
+    rows = data or []
+    return [
+        UsageEventDailyCount(
+            day=date.fromisoformat(row["day"]),
+            event_type=row["event_type"],
+            count=int(row["event_count"]),
+        )
+        for row in rows
+    ]
@@ -1,12 +1,81 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+
 from fastapi import HTTPException, status
 
+try:
+    from .settings import get_settings  # type: ignore[import]
+except ImportError:  # pragma: no cover - fallback for direct execution
+    from settings import get_settings  # type: ignore[import]
+
+
+@lru_cache(maxsize=1)
+def get_plan_limits() -> tuple[str, Dict[str, int]]:
+    """Load (default_plan, team_limits) from the plan limits file once per process.
+
+    The file defaults to `backend/plan_limits.json` and can be overridden with
+    the PLAN_LIMITS_FILE environment variable.
+    """
+
+    with open(get_settings().plan_limits_file, encoding="utf-8") as f:
+        data = json.load(f)
+
+    limits = {str(plan): int(limit) for plan, limit in data["team_limits"].items()}
+    default_plan = str(data.get("default_plan", "free"))
+    if default_plan not in limits:
+        raise ValueError(f"Default plan {default_plan!r} has no team limit")
+    return default_plan, limits
+
 
 def enforce_team_limit(plan: str, count: int) -> None:
 
-    limits = {"free": 5, "pro": 10}
-    limit = limits.get(plan, 5)
+    default_plan, limits = get_plan_limits()
+    limit = limits.get(plan, limits[default_plan])
     if count >= limit:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"{plan.capitalize()} plan is limited to {limit} team members.",
         )
+
+
+class PlanCache:
+    """Per-account subscription plan cache with a TTL.
+
+    `loader` fetches the authoritative plan (e.g. `profiles.subscription_plan`)
+    for an account and is only called on a miss, an expired entry or an
+    explicit `refresh`. At most `max_size` accounts are kept; the least
+    recently used entry is evicted first and expired entries are dropped on
+    access.
+    """
+
+    def __init__(self, loader: Callable[[str], Optional[str]], ttl_seconds: float, max_size: int = 1024) -> None:
+        self._loader = loader
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, account_id: str) -> str:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(account_id)
+            if entry is not None:
+                if entry[1] > now:
+                    self._entries.move_to_end(account_id)
+                    return entry[0]
+                del self._entries[account_id]
+        return self.refresh(account_id)
+
+    def refresh(self, account_id: str) -> str:
+        default_plan, _ = get_plan_limits()
+        plan = self._loader(account_id) or default_plan
+        with self._lock:
+            self._entries[account_id] = (plan, time.monotonic() + self._ttl_seconds)
+            self._entries.move_to_end(account_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return plan
@@ -0,0 +1,103 @@
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BASE_DIR = Path(__file__).resolve().parent
+
+DEFAULT_FRONTEND_ORIGINS = ["http://localhost:3000", "http://127.0.0.1:3000"]
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Backend configuration, resolved once per process.
+
+    Serverless hosts (e.g. Vercel) pay for every import and every per-request
+    lookup on a cold start, so the environment is read a single time and the
+    Supabase REST headers are built up front.
+    """
+
+    supabase_url: Optional[str]
+    supabase_service_role_key: Optional[str]
+    frontend_origins: List[str]
+    usage_analytics_enabled: bool
+    plan_cache_ttl_seconds: float
+    plan_limits_file: Path
+    trash_retention_days: float
+    trash_compact_interval_seconds: float
+    trash_cold_storage_file: Optional[Path]
+    supabase_jwt_secret: Optional[str]
+    jwt_audience: str
+    jwks_cache_ttl_seconds: float
+    rest_headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def supabase_configured(self) -> bool:
+        return bool(self.supabase_url and self.supabase_service_role_key)
+
+    @property
+    def rest_base_url(self) -> str:
+        return f"{(self.supabase_url or '').rstrip('/')}/rest/v1"
+
+
+def _load_dotenv_if_present() -> None:
+    # Deployed environments inject variables directly, so only pay for
+    # importing python-dotenv when a local `.env` file actually exists.
+    env_file = BASE_DIR / ".env"
+    if not env_file.is_file():
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv(env_file)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, loading `.env` on first use."""
+
+    _load_dotenv_if_present()
+
+    url = os.getenv("SUPABASE_URL")
+    key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+
+    frontend_origins_env = os.getenv("FRONTEND_ORIGINS")
+    if frontend_origins_env:
+        frontend_origins = [origin.strip() for origin in frontend_origins_env.split(",") if origin.strip()]
+    else:
+        frontend_origins = list(DEFAULT_FRONTEND_ORIGINS)
+
+    analytics_enabled = os.getenv("USAGE_ANALYTICS_ENABLED", "true").lower() in {"1", "true", "yes"}
+
+    plan_cache_ttl_seconds = float(os.getenv("PLAN_CACHE_TTL_SECONDS", "300"))
+    plan_limits_file = Path(os.getenv("PLAN_LIMITS_FILE") or BASE_DIR / "plan_limits.json")
+
+    trash_retention_days = float(os.getenv("TRASH_RETENTION_DAYS", "30"))
+    trash_compact_interval_seconds = float(os.getenv("TRASH_COMPACT_INTERVAL_SECONDS", "3600"))
+    trash_cold_storage_env = os.getenv("TRASH_COLD_STORAGE_FILE")
+    trash_cold_storage_file = Path(trash_cold_storage_env) if trash_cold_storage_env else None
+
+    rest_headers: Dict[str, str] = {}
+    if url and key:
+        rest_headers = {
+            "apikey": key,
+            "Authorization": f"Bearer {key}",
+            "Accept": "application/json",
+        }
+
+    return Settings(
+        supabase_url=url,
+        supabase_service_role_key=key,
+        frontend_origins=frontend_origins,
+        usage_analytics_enabled=analytics_enabled,
+        plan_cache_ttl_seconds=plan_cache_ttl_seconds,
+        plan_limits_file=plan_limits_file,
+        trash_retention_days=trash_retention_days,
+        trash_compact_interval_seconds=trash_compact_interval_seconds,
+        trash_cold_storage_file=trash_cold_storage_file,
+        supabase_jwt_secret=os.getenv("SUPABASE_JWT_SECRET") or None,
+        jwt_audience=os.getenv("SUPABASE_JWT_AUDIENCE", "authenticated"),
+        jwks_cache_ttl_seconds=float(os.getenv("JWKS_CACHE_TTL_SECONDS", "600")),
+        rest_headers=rest_headers,
+    )
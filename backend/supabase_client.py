@@ -1,8 +1,12 @@
-import os
 import json
 import time
 from urllib import request, error
 
+try:
+	from .settings import get_settings  # type: ignore[import]
+except ImportError:  # pragma: no cover - fallback for direct execution
+	from settings import get_settings  # type: ignore[import]
+
 
 def check_supabase_connection() -> tuple[bool, dict]:
 	"""Ping Supabase Auth health endpoint to verify connectivity and credentials.
@@ -12,15 +16,14 @@ def check_supabase_connection() -> tuple[bool, dict]:
 	only Supabase's free Auth health endpoint and does not require any paid
 	features.
 	"""
-	url = os.getenv("SUPABASE_URL")
-	key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-	if not url or not key:
+	settings = get_settings()
+	if not settings.supabase_configured:
 		return False, {"error": "SUPABASE_URL or SUPABASE_SERVICE_ROLE_KEY not set", "latency_ms": None}
 
-	health_url = f"{url.rstrip('/')}/auth/v1/health"
+	health_url = f"{settings.supabase_url.rstrip('/')}/auth/v1/health"
 	headers = {
-		"apikey": key,
-		"Authorization": f"Bearer {key}",
+		"apikey": settings.rest_headers["apikey"],
+		"Authorization": settings.rest_headers["Authorization"],
 	}
 
 	req = request.Request(health_url, headers=headers, method="GET")
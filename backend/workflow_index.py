@@ -0,0 +1,112 @@
+import re
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Protocol, Set, Tuple
+
+# (workflow_id, step_index); step_index is WORKFLOW_TITLE for the workflow's own title.
+Posting = Tuple[int, int]
+
+WORKFLOW_TITLE = -1
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class IndexedStep(Protocol):
+    title: str
+    assigned_to: str
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.casefold())
+
+
+def normalize_assignee(assignee: str) -> str:
+    return assignee.strip().casefold()
+
+
+class WorkflowIndex:
+    """In-memory inverted indexes over active workflows.
+
+    - assignee -> {(workflow_id, step_index)}
+    - title token -> {(workflow_id, step_index)}, with a sorted token list so
+      prefix queries only touch the matching tokens.
+
+    Callers keep it up to date as workflows are created, edited, deleted and
+    restored; lookups never scan the workflows list.
+    """
+
+    def __init__(self) -> None:
+        self._by_assignee: Dict[str, Set[Posting]] = {}
+        self._by_token: Dict[str, Set[Posting]] = {}
+        self._sorted_tokens: List[str] = []
+
+    # -- maintenance --------------------------------------------------------
+
+    def add_workflow(self, workflow_id: int, title: str, steps: Iterable[IndexedStep]) -> None:
+        self._add_title(title, (workflow_id, WORKFLOW_TITLE))
+        for step_index, step in enumerate(steps):
+            self.add_step(workflow_id, step_index, step)
+
+    def remove_workflow(self, workflow_id: int, title: str, steps: Iterable[IndexedStep]) -> None:
+        self._remove_title(title, (workflow_id, WORKFLOW_TITLE))
+        for step_index, step in enumerate(steps):
+            self.remove_step(workflow_id, step_index, step)
+
+    def add_step(self, workflow_id: int, step_index: int, step: IndexedStep) -> None:
+        posting = (workflow_id, step_index)
+        self._by_assignee.setdefault(normalize_assignee(step.assigned_to), set()).add(posting)
+        self._add_title(step.title, posting)
+
+    def remove_step(self, workflow_id: int, step_index: int, step: IndexedStep) -> None:
+        posting = (workflow_id, step_index)
+        key = normalize_assignee(step.assigned_to)
+        postings = self._by_assignee.get(key)
+        if postings is not None:
+            postings.discard(posting)
+            if not postings:
+                del self._by_assignee[key]
+        self._remove_title(step.title, posting)
+
+    def _add_title(self, title: str, posting: Posting) -> None:
+        for token in set(tokenize(title)):
+            postings = self._by_token.get(token)
+            if postings is None:
+                postings = self._by_token[token] = set()
+                insort(self._sorted_tokens, token)
+            postings.add(posting)
+
+    def _remove_title(self, title: str, posting: Posting) -> None:
+        for token in set(tokenize(title)):
+            postings = self._by_token.get(token)
+            if postings is None:
+                continue
+            postings.discard(posting)
+            if not postings:
+                del self._by_token[token]
+                del self._sorted_tokens[bisect_left(self._sorted_tokens, token)]
+
+    # -- queries ------------------------------------------------------------
+
+    def steps_assigned_to(self, assignee: str) -> List[Posting]:
+        return sorted(self._by_assignee.get(normalize_assignee(assignee), ()))
+
+    def _prefix_postings(self, prefix: str) -> Set[Posting]:
+        matched: Set[Posting] = set()
+        i = bisect_left(self._sorted_tokens, prefix)
+        while i < len(self._sorted_tokens) and self._sorted_tokens[i].startswith(prefix):
+            matched |= self._by_token[self._sorted_tokens[i]]
+            i += 1
+        return matched
+
+    def search_workflows(self, query: str) -> List[int]:
+        """Return ids of workflows matching every query token by prefix.
+
+        A token can match the workflow title or any of its step titles.
+        """
+
+        workflow_ids: Set[int] | None = None
+        for token in set(tokenize(query)):
+            ids = {workflow_id for workflow_id, _ in self._prefix_postings(token)}
+            workflow_ids = ids if workflow_ids is None else workflow_ids & ids
+            if not workflow_ids:
+                return []
+        return sorted(workflow_ids or ())
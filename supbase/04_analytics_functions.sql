@@ -0,0 +1,56 @@
+-- Aggregate functions for TaskVault analytics.
+-- Run this after 01_schema.sql and 03_schema_advanced.sql.
+--
+-- These are exposed through PostgREST as `POST /rest/v1/rpc/<name>` and return
+-- only counts, so the dashboard cost stays constant as tables grow.
+
+-- 1) Team composition counts (used by GET /analytics/overview)
+create or replace function team_member_stats()
+returns table (
+  total_members bigint,
+  admins bigint,
+  members bigint
+)
+language sql
+stable
+as $$
+  select
+    count(*) as total_members,
+    count(*) filter (where role = 'admin') as admins,
+    count(*) filter (where role = 'member') as members
+  from team_members;
+$$;
+
+-- 2) Per-event-type daily counts (used by GET /analytics/usage-events)
+-- With p_event_type this range-scans idx_usage_events_event_type_created_at;
+-- without it (the default) the time-range filter uses idx_usage_events_created_at,
+-- so only rows inside the requested window are read.
+create index if not exists idx_usage_events_created_at
+  on usage_events (created_at desc);
+
+create or replace function usage_event_daily_counts(
+  p_since timestamptz,
+  p_event_type text default null
+)
+returns table (
+  day date,
+  event_type text,
+  event_count bigint
+)
+language sql
+stable
+as $$
+  select
+    (ue.created_at at time zone 'utc')::date as day,
+    ue.event_type,
+    count(*) as event_count
+  from usage_events ue
+  where ue.created_at >= p_since
+    and (p_event_type is null or ue.event_type = p_event_type)
+  group by 1, 2
+  order by 1 desc, 2;
+$$;
+
+-- Only the backend (service role) should call these.
+revoke execute on function team_member_stats() from public, anon, authenticated;
+revoke execute on function usage_event_daily_counts(timestamptz, text) from public, anon, authenticated;
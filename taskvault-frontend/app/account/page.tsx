@@ -5,6 +5,9 @@ import { useRouter } from "next/navigation";
 import { supabase } from "../../lib/supabaseClient";
 import { motion } from "framer-motion";
 import { Skeleton } from "@/components/ui/Skeleton";
+import { authHeaders } from "@/lib/authHeaders";
+
+const API_BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL ?? "http://localhost:8000";
 
 type Plan = "free" | "pro";
 
@@ -111,6 +114,18 @@ export default function AccountPage() {
     }
   }
 
+  async function refreshBackendPlan() {
+    // Let the backend plan cache pick up the new plan immediately.
+    try {
+      await fetch(`${API_BASE_URL}/account/plan/refresh`, {
+        method: "POST",
+        headers: await authHeaders(),
+      });
+    } catch (err) {
+      console.error("Failed to refresh backend plan cache", err);
+    }
+  }
+
   async function mockUpgradeToPro() {
     if (state.status !== "ready") return;
     setUpdating(true);
@@ -121,6 +136,7 @@ export default function AccountPage() {
         .eq("email", state.email ?? "");
       if (!error) {
         setState({ ...state, plan: "pro" });
+        await refreshBackendPlan();
       }
     } catch (err) {
       console.error("Failed to upgrade mock plan", err);
@@ -139,6 +155,7 @@ export default function AccountPage() {
         .eq("email", state.email ?? "");
       if (!error) {
         setState({ ...state, plan: "free" });
+        await refreshBackendPlan();
       }
     } catch (err) {
       console.error("Failed to downgrade mock plan", err);
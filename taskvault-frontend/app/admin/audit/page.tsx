@@ -2,6 +2,7 @@
 
 import { useEffect, useState } from "react";
 import { motion } from "framer-motion";
+import { authHeaders } from "@/lib/authHeaders";
 
 const API_BASE_URL =
   process.env.NEXT_PUBLIC_API_BASE_URL ?? "http://localhost:8000";
@@ -44,9 +45,13 @@ export default function AuditLogsPage() {
   useEffect(() => {
     async function loadLogs() {
       try {
-        const res = await fetch(`${API_BASE_URL}/audit-logs?actor_role=admin&limit=50`);
+        const res = await fetch(`${API_BASE_URL}/audit-logs?limit=50`, {
+          headers: await authHeaders(),
+        });
         if (!res.ok) {
-          if (res.status === 403) {
+          if (res.status === 401) {
+            setError("Sign in to view audit logs.");
+          } else if (res.status === 403) {
             setError("Only admins can view audit logs.");
           } else {
             setError("Failed to load audit logs.");
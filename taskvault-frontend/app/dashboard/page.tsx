@@ -33,6 +33,7 @@ import {
   type TourStep,
 } from "@/components/onboarding/GuidedTour";
 import { Page } from "@/components/motion/Page";
+import { useChangeFeed } from "@/hooks/useChangeFeed";
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL ?? "http://localhost:8000";
 
@@ -152,8 +153,30 @@ export default function DashboardPage() {
     }
   }
 
+  // Apply live counter deltas instead of re-fetching the whole overview.
+  const markLoaded = useChangeFeed({
+    stats: (delta: { workflows?: Partial<WorkflowStats> }) => {
+      if (!delta.workflows) return;
+      setData((prev) => {
+        if (!prev) return prev;
+        const workflows = { ...prev.workflows };
+        for (const [key, amount] of Object.entries(delta.workflows ?? {})) {
+          const statKey = key as keyof WorkflowStats;
+          workflows[statKey] = (workflows[statKey] ?? 0) + (amount ?? 0);
+        }
+        return { ...prev, workflows };
+      });
+    },
+    team_changed: () => {
+      void loadAnalytics();
+    },
+    resync: () => {
+      void loadAnalytics();
+    },
+  });
+
   useEffect(() => {
-    loadAnalytics();
+    loadAnalytics().then(markLoaded);
     checkBackendHealth();
   }, []);
 
@@ -7,6 +7,8 @@ import { UsageBanner } from "@/components/ui/UsageBanner";
 import { useToast } from "@/components/ui/Toast";
 import { canManageTeam, type Role } from "@/lib/permissions";
 import { Page } from "@/components/motion/Page";
+import { authHeaders } from "@/lib/authHeaders";
+import { useChangeFeed } from "@/hooks/useChangeFeed";
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL ?? "http://localhost:8000";
 
@@ -48,6 +50,37 @@ export default function TeamPage() {
     }
   }
 
+  function upsertMember(member: TeamMember) {
+    setState((prev) => {
+      if (prev.status !== "ready") return prev;
+      const members = prev.members.some((m) => m.id === member.id)
+        ? prev.members.map((m) => (m.id === member.id ? member : m))
+        : [...prev.members, member];
+      return { ...prev, members };
+    });
+  }
+
+  function dropMember(memberId: number) {
+    setState((prev) => {
+      if (prev.status !== "ready") return prev;
+      return { ...prev, members: prev.members.filter((m) => m.id !== memberId) };
+    });
+  }
+
+  // Apply live team changes instead of re-fetching the whole team.
+  const markLoaded = useChangeFeed({
+    team_changed: (data: { action: string; member?: TeamMember; member_id?: number }) => {
+      if (data.action === "removed" && data.member_id !== undefined) {
+        dropMember(data.member_id);
+      } else if (data.member) {
+        upsertMember(data.member);
+      }
+    },
+    resync: () => {
+      void fetchTeam();
+    },
+  });
+
   useEffect(() => {
     async function loadProfileAndTeam() {
     try {
@@ -79,6 +112,7 @@ export default function TeamPage() {
 
     setState({ status: "ready", email, plan, members: [] });
     await fetchTeam();
+    markLoaded();
     } catch (err) {
     console.error("Failed to initialize team profile", err);
     setState({ status: "signed_out" });
@@ -116,8 +150,8 @@ export default function TeamPage() {
     try {
       const res = await fetch(`${API_BASE_URL}/team/add`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ email, role, plan: state.plan }),
+        headers: { "Content-Type": "application/json", ...(await authHeaders()) },
+        body: JSON.stringify({ email, role }),
       });
 
       if (!res.ok) {
@@ -140,8 +174,9 @@ export default function TeamPage() {
         return;
       }
 
+      const added: TeamMember = await res.json();
+      upsertMember(added);
       setEmail("");
-      await fetchTeam();
       push("Team member added", "success");
     } finally {
       setSubmitting(false);
@@ -155,10 +190,10 @@ export default function TeamPage() {
 
     try {
       const res = await fetch(
-        `${API_BASE_URL}/team/${memberId}/role?actor_role=admin`,
+        `${API_BASE_URL}/team/${memberId}/role`,
         {
         method: "PATCH",
-        headers: { "Content-Type": "application/json" },
+        headers: { "Content-Type": "application/json", ...(await authHeaders()) },
         body: JSON.stringify({ role: newRole }),
         },
       );
@@ -169,7 +204,8 @@ export default function TeamPage() {
         }
         return;
       }
-      await fetchTeam();
+      const updated: TeamMember = await res.json();
+      upsertMember(updated);
       push("Member role updated", "success");
     } catch (err) {
       console.error("Failed to update role", err);
@@ -184,9 +220,10 @@ export default function TeamPage() {
 
     try {
       const res = await fetch(
-        `${API_BASE_URL}/team/${memberId}?actor_role=admin`,
+        `${API_BASE_URL}/team/${memberId}`,
         {
           method: "DELETE",
+          headers: await authHeaders(),
         },
       );
 
@@ -196,7 +233,7 @@ export default function TeamPage() {
         }
         return;
       }
-      await fetchTeam();
+      dropMember(memberId);
       push("Member removed", "success");
     } catch (err) {
       console.error("Failed to remove member", err);
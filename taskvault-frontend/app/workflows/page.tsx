@@ -315,6 +315,7 @@ import { WorkflowCard } from "@/components/workflows/WorkflowCard";
 import { EmptyState } from "@/components/ui/EmptyState";
 import { useToast } from "@/components/ui/Toast";
 import { Page } from "@/components/motion/Page";
+import { useChangeFeed } from "@/hooks/useChangeFeed";
 
 const API_BASE_URL =
   process.env.NEXT_PUBLIC_API_BASE_URL ?? "http://localhost:8000";
@@ -354,8 +355,42 @@ export default function WorkflowsPage() {
     }
   }
 
+  function upsertWorkflow(workflow: Workflow) {
+    setWorkflows((prev) =>
+      prev.some((wf) => wf.id === workflow.id)
+        ? prev.map((wf) => (wf.id === workflow.id ? workflow : wf))
+        : [...prev, workflow].sort((a, b) => a.id - b.id),
+    );
+  }
+
+  // Apply live changes from other tabs/users instead of re-fetching the list.
+  const markLoaded = useChangeFeed({
+    workflow_created: (data: { workflow: Workflow }) => upsertWorkflow(data.workflow),
+    workflow_restored: (data: { workflow: Workflow }) => upsertWorkflow(data.workflow),
+    workflow_deleted: (data: { id: number }) => {
+      setWorkflows((prev) => prev.filter((wf) => wf.id !== data.id));
+    },
+    step_updated: (data: { workflow_id: number; step_index: number; step: Step }) => {
+      setWorkflows((prev) =>
+        prev.map((wf) =>
+          wf.id === data.workflow_id
+            ? {
+                ...wf,
+                steps: wf.steps.map((step, idx) =>
+                  idx === data.step_index ? data.step : step,
+                ),
+              }
+            : wf,
+        ),
+      );
+    },
+    resync: () => {
+      void fetchWorkflows();
+    },
+  });
+
   useEffect(() => {
-    fetchWorkflows();
+    fetchWorkflows().then(markLoaded);
   }, []);
 
   function updateStep(index: number, field: keyof Step, value: string) {
@@ -443,9 +478,10 @@ export default function WorkflowsPage() {
         return;
       }
 
+      const created: Workflow = await res.json();
+      upsertWorkflow(created);
       setTitle("");
       setSteps([{ title: "", assigned_to: "" }]);
-      await fetchWorkflows();
       push("Workflow created", "success");
     } finally {
       setLoading(false);
@@ -0,0 +1,61 @@
+"use client";
+
+import { useCallback, useEffect, useRef } from "react";
+
+const API_BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL ?? "http://localhost:8000";
+
+export type ChangeFeedHandlers = Partial<Record<string, (data: any) => void>>;
+
+// Subscribe to the backend `/events` server-sent events stream.
+// Handlers are keyed by event type (e.g. "stats", "team_changed", "resync").
+//
+// The server does not replay events missed while disconnected, so the
+// `resync` handler also runs whenever the stream (re)opens after data was
+// loaded: on every reconnect, and on the first open if the page's initial
+// load already finished. Call the returned `markLoaded` once that initial
+// load completes.
+export function useChangeFeed(handlers: ChangeFeedHandlers) {
+  const handlersRef = useRef(handlers);
+  handlersRef.current = handlers;
+  const openedRef = useRef(false);
+  const loadedRef = useRef(false);
+
+  const markLoaded = useCallback(() => {
+    loadedRef.current = true;
+  }, []);
+
+  useEffect(() => {
+    const source = new EventSource(`${API_BASE_URL}/events`);
+    source.onopen = () => {
+      if (openedRef.current || loadedRef.current) {
+        handlersRef.current.resync?.({});
+      }
+      openedRef.current = true;
+    };
+    const eventTypes = Object.keys(handlersRef.current);
+
+    const listeners = eventTypes.map((type) => {
+      const listener = (e: MessageEvent) => {
+        let data: unknown = {};
+        try {
+          data = JSON.parse(e.data);
+        } catch {
+          // Ignore malformed frames.
+        }
+        handlersRef.current[type]?.(data);
+      };
+      source.addEventListener(type, listener);
+      return [type, listener] as const;
+    });
+
+    return () => {
+      for (const [type, listener] of listeners) {
+        source.removeEventListener(type, listener);
+      }
+      source.onopen = null;
+      source.close();
+    };
+  }, []);
+
+  return markLoaded;
+}
@@ -0,0 +1,10 @@
+import { supabase } from "./supabaseClient";
+
+// Authorization header for backend calls, carrying the current Supabase
+// access token. The backend verifies it and derives the caller's role.
+export async function authHeaders(): Promise<Record<string, string>> {
+  const {
+    data: { session },
+  } = await supabase.auth.getSession();
+  return session ? { Authorization: `Bearer ${session.access_token}` } : {};
+}